@@ -0,0 +1,60 @@
+import asyncio
+from typing import Optional
+from fastapi import APIRouter, Query
+from fastapi.concurrency import run_in_threadpool
+from app.config import settings
+from app.models.movie import CatalogChanges
+from app.services.catalog_service import catalog_service
+from app.services.movie_service import movie_service
+from app.services.series_service import series_service
+
+router = APIRouter()
+
+# One rescan at a time, shared by every request that needs it
+_rescan_task: Optional[asyncio.Task] = None
+_watch_task: Optional[asyncio.Task] = None
+_waiting = 0
+
+def _rescan():
+    """Rescan the library so the change log reflects the disk"""
+    movie_service.scan_movies()
+    series_service.scan_series()
+
+async def _shared_rescan():
+    """Join the rescan in flight, or start one"""
+    global _rescan_task
+    if _rescan_task is None or _rescan_task.done():
+        _rescan_task = asyncio.ensure_future(run_in_threadpool(_rescan))
+    await asyncio.shield(_rescan_task)
+
+async def _watch():
+    """Rescan periodically while any client is long-polling"""
+    while _waiting:
+        await asyncio.sleep(settings.CATALOG_POLL_INTERVAL)
+        try:
+            await _shared_rescan()
+        except Exception as e:
+            print(f"Error rescanning catalog: {e}")
+
+@router.get("/changes", response_model=CatalogChanges)
+async def get_catalog_changes(
+    since: Optional[str] = None,
+    wait: int = Query(0, ge=0, le=settings.CATALOG_MAX_WAIT)
+):
+    """Get catalog changes since a token, optionally long-polling up to `wait` seconds"""
+    global _watch_task, _waiting
+    
+    await _shared_rescan()
+    result = catalog_service.get_changes(since)
+    if result.resync or result.changes or not wait:
+        return result
+    
+    _waiting += 1
+    if _watch_task is None or _watch_task.done():
+        _watch_task = asyncio.ensure_future(_watch())
+    try:
+        await catalog_service.wait_for_change(result.token, wait)
+    finally:
+        _waiting -= 1
+    
+    return catalog_service.get_changes(since)
@@ -0,0 +1,12 @@
+from typing import List
+from fastapi import APIRouter
+from app.models.movie import RootHealth
+from app.services.movie_service import movie_service
+from app.services.series_service import series_service
+
+router = APIRouter()
+
+@router.get("/roots", response_model=List[RootHealth])
+async def get_library_roots():
+    """Get the health of every movie and series library root"""
+    return movie_service.library.health() + series_service.library.health()
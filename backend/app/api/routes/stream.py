@@ -1,35 +1,86 @@
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import StreamingResponse, FileResponse
+from fastapi import APIRouter, Header, HTTPException, Query
+from fastapi.responses import StreamingResponse, FileResponse, JSONResponse, Response
 from pathlib import Path
+from typing import Optional, Tuple
+from app.config import settings
+from app.models.movie import SeekMap
+from app.services.keyframe_service import keyframe_service
 from app.services.movie_service import movie_service
 from app.services.series_service import series_service
 from app.services.streaming_service import streaming_service
+from app.services.subtitle_service import subtitle_service
 
 router = APIRouter()
 
-@router.get("/movie/{movie_id}")
-async def stream_movie(movie_id: str):
-    """Stream a movie"""
-    movie = movie_service.get_movie_by_id(movie_id)
-    
-    if not movie:
-        raise HTTPException(status_code=404, detail="Movie not found")
+# Detect MIME type based on file extension
+MIME_TYPES = {
+    '.mp4': 'video/mp4',
+    '.mkv': 'video/x-matroska',
+    '.avi': 'video/x-msvideo',
+    '.mov': 'video/quicktime',
+    '.webm': 'video/webm'
+}
+
+def _parse_range(range_header: str, file_size: int) -> Optional[Tuple[int, int]]:
+    """Parse a single 'bytes=start-end' range; None if unsatisfiable"""
+    unit, _, spec = range_header.partition("=")
+    start, _, end = spec.strip().partition("-")
+    if unit.strip() != "bytes" or "," in spec:
+        return None
+    try:
+        if start:
+            first = int(start)
+            last = min(int(end), file_size - 1) if end else file_size - 1
+        else:
+            # Suffix range: the last N bytes
+            first = max(file_size - int(end), 0)
+            last = file_size - 1
+    except ValueError:
+        return None
+    if first > last or first >= file_size:
+        return None
+    return first, last
+
+def _stream_response(file_path: Path, t: Optional[float] = None, range_header: Optional[str] = None):
+    """Build the response for a video file, honouring Range and ?t= keyframe lookups"""
+    file_size = file_path.stat().st_size
+    media_type = MIME_TYPES.get(file_path.suffix.lower(), 'video/mp4')
     
-    file_path = Path(movie.file_path)
-    if not file_path.exists():
-        raise HTTPException(status_code=404, detail="Movie file not found")
+    # Time-based seek: report the keyframe's byte offset so the client can
+    # issue one precise range request; headers are absent until indexed
+    if t is not None:
+        index = keyframe_service.get_index(file_path)
+        keyframe = index.lookup(t) if index else None
+        headers = {"Accept-Ranges": "bytes"}
+        if keyframe:
+            keyframe_time, offset = keyframe
+            headers["X-Keyframe-Time"] = str(keyframe_time)
+            headers["X-Keyframe-Offset"] = str(offset)
+        return Response(status_code=204, headers=headers)
     
-    file_size = file_path.stat().st_size
+    # Let nginx serve the bytes (with range support) when offloading is enabled
+    accel_uri = streaming_service.get_accel_redirect_uri(str(file_path))
+    if accel_uri:
+        return Response(
+            media_type=media_type,
+            headers={"X-Accel-Redirect": accel_uri}
+        )
     
-    # Detect MIME type based on file extension
-    mime_types = {
-        '.mp4': 'video/mp4',
-        '.mkv': 'video/x-matroska',
-        '.avi': 'video/x-msvideo',
-        '.mov': 'video/quicktime',
-        '.webm': 'video/webm'
-    }
-    media_type = mime_types.get(file_path.suffix.lower(), 'video/mp4')
+    if range_header:
+        byte_range = _parse_range(range_header, file_size)
+        if byte_range is None:
+            return Response(status_code=416, headers={"Content-Range": f"bytes */{file_size}"})
+        start, end = byte_range
+        return StreamingResponse(
+            streaming_service.stream_file(str(file_path), start=start, end=end),
+            status_code=206,
+            media_type=media_type,
+            headers={
+                "Accept-Ranges": "bytes",
+                "Content-Length": str(end - start + 1),
+                "Content-Range": f"bytes {start}-{end}/{file_size}",
+            }
+        )
     
     return StreamingResponse(
         streaming_service.stream_file(str(file_path)),
@@ -40,8 +91,30 @@ async def stream_movie(movie_id: str):
         }
     )
 
+@router.get("/movie/{movie_id}")
+async def stream_movie(
+    movie_id: str,
+    t: Optional[float] = Query(None, ge=0),
+    range_header: Optional[str] = Header(None, alias="Range")
+):
+    """Stream a movie"""
+    movie = movie_service.get_movie_by_id(movie_id)
+    
+    if not movie:
+        raise HTTPException(status_code=404, detail="Movie not found")
+    
+    file_path = Path(movie.file_path)
+    if not file_path.exists():
+        raise HTTPException(status_code=404, detail="Movie file not found")
+    
+    return _stream_response(file_path, t, range_header)
+
 @router.get("/episode/{episode_id}")
-async def stream_episode(episode_id: str):
+async def stream_episode(
+    episode_id: str,
+    t: Optional[float] = Query(None, ge=0),
+    range_header: Optional[str] = Header(None, alias="Range")
+):
     """Stream an episode"""
     episode = series_service.get_episode_by_id(episode_id)
     
@@ -52,26 +125,35 @@ async def stream_episode(episode_id: str):
     if not file_path.exists():
         raise HTTPException(status_code=404, detail="Episode file not found")
     
-    file_size = file_path.stat().st_size
+    return _stream_response(file_path, t, range_header)
+
+@router.get("/seekmap/{item_type}/{item_id}", response_model=SeekMap)
+async def get_seek_map(item_type: str, item_id: str):
+    """Get the keyframe time to byte offset map for a movie or episode"""
+    if item_type == "movie":
+        item = movie_service.get_movie_by_id(item_id)
+    elif item_type == "episode":
+        item = series_service.get_episode_by_id(item_id)
+    else:
+        raise HTTPException(status_code=400, detail="Invalid item type")
     
-    # Detect MIME type based on file extension
-    mime_types = {
-        '.mp4': 'video/mp4',
-        '.mkv': 'video/x-matroska',
-        '.avi': 'video/x-msvideo',
-        '.mov': 'video/quicktime',
-        '.webm': 'video/webm'
-    }
-    media_type = mime_types.get(file_path.suffix.lower(), 'video/mp4')
+    if not item:
+        raise HTTPException(status_code=404, detail="Item not found")
     
-    return StreamingResponse(
-        streaming_service.stream_file(str(file_path)),
-        media_type=media_type,
-        headers={
-            "Accept-Ranges": "bytes",
-            "Content-Length": str(file_size),
-        }
-    )
+    file_path = Path(item.file_path)
+    if not file_path.exists():
+        raise HTTPException(status_code=404, detail="Video file not found")
+    
+    if file_path.suffix.lower() not in settings.KEYFRAME_INDEX_FORMATS:
+        raise HTTPException(status_code=404, detail="No keyframe index for this file type")
+    
+    index = keyframe_service.get_index(file_path)
+    if index is None:
+        return JSONResponse(status_code=202, content={"detail": "Keyframe index not available yet"})
+    if not index:
+        raise HTTPException(status_code=404, detail="Keyframe index unavailable for this file")
+    
+    return SeekMap(times=index.times.tolist(), offsets=index.offsets.tolist())
 
 @router.get("/subtitle/{subtitle_type}/{item_id}/{subtitle_filename}")
 async def get_subtitle(subtitle_type: str, item_id: str, subtitle_filename: str):
@@ -90,7 +172,14 @@ async def get_subtitle(subtitle_type: str, item_id: str, subtitle_filename: str)
     subtitle_path = None
     for subtitle in item.subtitles:
         if subtitle.filename == subtitle_filename:
-            subtitle_path = Path(subtitle.file_path)
+            if subtitle.embedded:
+                try:
+                    subtitle_path = await subtitle_service.get_subtitle_path(subtitle)
+                except Exception as e:
+                    print(f"Error extracting subtitle {subtitle_filename}: {e}")
+                    raise HTTPException(status_code=500, detail="Subtitle extraction failed")
+            else:
+                subtitle_path = Path(subtitle.file_path)
             break
     
     if not subtitle_path or not subtitle_path.exists():
@@ -9,13 +9,42 @@ class Settings:
     # Media settings
     MOVIES_PATH: str = os.getenv("MOVIES_PATH", "/app/media/movies")
     SERIES_PATH: str = os.getenv("SERIES_PATH", "/app/media/series")
+    
+    # Library roots: comma-separated, "path|N" sets that root's scan concurrency.
+    # The root equal to MOVIES_PATH/SERIES_PATH keeps bare item IDs.
+    MOVIES_PATHS: List[str] = os.getenv("MOVIES_PATHS", MOVIES_PATH).split(",")
+    SERIES_PATHS: List[str] = os.getenv("SERIES_PATHS", SERIES_PATH).split(",")
+    ROOT_SCAN_CONCURRENCY: int = int(os.getenv("ROOT_SCAN_CONCURRENCY", "4"))
+    ROOT_SCAN_TIMEOUT: float = float(os.getenv("ROOT_SCAN_TIMEOUT", "3"))  # longest wait on a fresh root scan
     SUPPORTED_VIDEO_FORMATS: List[str] = [".mp4", ".mkv", ".avi", ".mov", ".webm"]
     SUPPORTED_SUBTITLE_FORMATS: List[str] = [".srt", ".vtt", ".ass", ".ssa"]
     
+    # Embedded subtitles
+    EMBEDDED_SUBTITLE_CONTAINERS: List[str] = [".mp4", ".mkv", ".mov", ".webm"]
+    SUBTITLE_CACHE_PATH: str = os.getenv("SUBTITLE_CACHE_PATH", "/app/cache/subtitles")
+    SUBTITLE_EXTRACT_WORKERS: int = int(os.getenv("SUBTITLE_EXTRACT_WORKERS", "2"))
+    SUBTITLE_EXTRACT_TIMEOUT: int = 120  # seconds per ffmpeg run
+    
     # CORS
     CORS_ORIGINS: List[str] = os.getenv("CORS_ORIGINS", "http://localhost").split(",")
     
+    # Keyframe index for time-based seeking
+    KEYFRAME_INDEX_FORMATS: List[str] = [".mkv", ".avi"]
+    KEYFRAME_INDEX_WORKERS: int = int(os.getenv("KEYFRAME_INDEX_WORKERS", "1"))
+    KEYFRAME_INDEX_TIMEOUT: int = 300  # seconds per ffprobe run
+    KEYFRAME_INDEX_RETRY: int = 600  # seconds before retrying a timed-out build
+    
+    # Catalog change tracking
+    CATALOG_CHANGE_LOG_SIZE: int = int(os.getenv("CATALOG_CHANGE_LOG_SIZE", "1000"))
+    CATALOG_POLL_INTERVAL: float = 5.0  # seconds between rescans while long-polling
+    CATALOG_MAX_WAIT: int = 60  # longest allowed long-poll in seconds
+    
     # Streaming
     CHUNK_SIZE: int = 1024 * 1024  # 1MB chunks
+    
+    # Offload video bytes to nginx via X-Accel-Redirect
+    ACCEL_REDIRECT_ENABLED: bool = os.getenv("ACCEL_REDIRECT_ENABLED", "false").lower() in ("1", "true", "yes")
+    ACCEL_REDIRECT_PREFIX: str = os.getenv("ACCEL_REDIRECT_PREFIX", "/protected-media")
+    MEDIA_ROOT: str = os.getenv("MEDIA_ROOT", "/app/media")
 
 settings = Settings()
@@ -1,7 +1,7 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.config import settings
-from app.api.routes import movies, series, stream
+from app.api.routes import movies, series, stream, catalog, library
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -21,6 +21,8 @@ app.add_middleware(
 app.include_router(movies.router, prefix=f"{settings.API_PREFIX}/movies", tags=["movies"])
 app.include_router(series.router, prefix=f"{settings.API_PREFIX}/series", tags=["series"])
 app.include_router(stream.router, prefix=f"{settings.API_PREFIX}/stream", tags=["stream"])
+app.include_router(catalog.router, prefix=f"{settings.API_PREFIX}/catalog", tags=["catalog"])
+app.include_router(library.router, prefix=f"{settings.API_PREFIX}/library", tags=["library"])
 
 @app.get("/")
 async def root():
@@ -1,11 +1,14 @@
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import Optional, List, Union
 
 class Subtitle(BaseModel):
     language: str  # Keep as code for now
     language_code: str = ""  # Add this field
     file_path: str
     filename: str
+    embedded: bool = False  # Muxed inside the video, extracted on demand
+    stream_index: Optional[int] = None
+    source_path: Optional[str] = None
     
     def __init__(self, **data):
         super().__init__(**data)
@@ -75,4 +78,29 @@ class MovieList(BaseModel):
 
 class SeriesList(BaseModel):
     series: List[Series]
-    total: int
\ No newline at end of file
+    total: int
+
+class SeekMap(BaseModel):
+    times: List[float]  # Keyframe timestamps in seconds
+    offsets: List[int]  # Byte offset of each keyframe
+
+class RootHealth(BaseModel):
+    kind: str  # "movie" or "series"
+    path: str
+    status: str  # "pending", "online", "slow", "offline" or "error"
+    concurrency: int
+    item_count: int
+    last_scan_seconds: Optional[float] = None
+    error: Optional[str] = None
+
+class CatalogChange(BaseModel):
+    generation: int
+    action: str  # "add", "update" or "remove"
+    kind: str  # "movie" or "series"
+    id: str
+    item: Optional[Union[Movie, Series]] = None  # Omitted for removals
+
+class CatalogChanges(BaseModel):
+    token: str
+    resync: bool = False  # Token unknown or too old, refetch the full lists
+    changes: List[CatalogChange] = []
@@ -0,0 +1,128 @@
+import asyncio
+import hashlib
+import threading
+import uuid
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple, Union
+from app.config import settings
+from app.models.movie import CatalogChange, CatalogChanges, Movie, Series
+
+class CatalogService:
+    """Tracks catalog mutations between scans as a bounded change log"""
+
+    def __init__(self):
+        # A fresh epoch per process invalidates tokens issued before a restart
+        self._epoch = uuid.uuid4().hex[:8]
+        self._generation = 0
+        self._floor = 0  # Oldest generation the log can still answer from
+        self._log: Deque[CatalogChange] = deque()
+        self._fingerprints: Dict[Tuple[str, str], str] = {}
+        self._seen_kinds = set()
+        self._waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def token(self) -> str:
+        return f"{self._epoch}-{self._generation}"
+
+    def update(self, kind: str, items: List[Union[Movie, Series]]):
+        """Diff a fresh scan of one media type against the last one"""
+        current = {
+            (kind, item.id): (self._fingerprint(item), item)
+            for item in items
+        }
+
+        with self._lock:
+            # The first scan of a kind is the baseline, not a burst of additions.
+            # Tokens handed out before it never saw these items, so force a resync.
+            if kind not in self._seen_kinds:
+                self._seen_kinds.add(kind)
+                for key, (fingerprint, _) in current.items():
+                    self._fingerprints[key] = fingerprint
+                self._generation += 1
+                self._floor = self._generation
+                self._wake_waiters()
+                return
+
+            changes = []
+            for key, (fingerprint, item) in current.items():
+                previous = self._fingerprints.get(key)
+                if previous is None:
+                    changes.append(("add", key, item))
+                elif previous != fingerprint:
+                    changes.append(("update", key, item))
+
+            for key in list(self._fingerprints):
+                if key[0] == kind and key not in current:
+                    changes.append(("remove", key, None))
+
+            if not changes:
+                return
+
+            self._generation += 1
+            for action, key, item in changes:
+                if item is None:
+                    self._fingerprints.pop(key, None)
+                else:
+                    self._fingerprints[key] = current[key][0]
+                self._log.append(CatalogChange(
+                    generation=self._generation,
+                    action=action,
+                    kind=kind,
+                    id=key[1],
+                    item=item
+                ))
+
+            while len(self._log) > settings.CATALOG_CHANGE_LOG_SIZE:
+                self._floor = self._log.popleft().generation
+
+            self._wake_waiters()
+
+    def _wake_waiters(self):
+        """Scans run in worker threads, wake long-pollers on their own loops"""
+        for loop, event in self._waiters:
+            loop.call_soon_threadsafe(event.set)
+
+    def get_changes(self, since: Optional[str]) -> CatalogChanges:
+        """Return changes after the given token, or ask for a full resync"""
+        with self._lock:
+            generation = self._parse_token(since)
+            if generation is None or generation < self._floor or generation > self._generation:
+                return CatalogChanges(token=self.token, resync=True)
+
+            changes = [change for change in self._log if change.generation > generation]
+            return CatalogChanges(token=self.token, changes=changes)
+
+    async def wait_for_change(self, since: Optional[str], timeout: float):
+        """Wait until the catalog moves past the given token, or the timeout"""
+        loop = asyncio.get_running_loop()
+        event = asyncio.Event()
+        waiter = (loop, event)
+
+        with self._lock:
+            if self._parse_token(since) != self._generation:
+                return
+            self._waiters.append(waiter)
+
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            with self._lock:
+                self._waiters.remove(waiter)
+
+    def _parse_token(self, token: Optional[str]) -> Optional[int]:
+        """Extract the generation from a token issued by this process"""
+        if not token:
+            return None
+
+        epoch, _, generation = token.partition("-")
+        if epoch != self._epoch or not generation.isdigit():
+            return None
+        return int(generation)
+
+    def _fingerprint(self, item: Union[Movie, Series]) -> str:
+        return hashlib.sha1(item.model_dump_json().encode()).hexdigest()
+
+catalog_service = CatalogService()
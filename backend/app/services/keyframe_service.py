@@ -0,0 +1,141 @@
+import subprocess
+import threading
+import time
+from array import array
+from bisect import bisect_right
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+from pathlib import Path
+from app.config import settings
+
+class KeyframeIndex:
+    """Keyframe timestamps and their byte offsets, stored as packed arrays"""
+
+    def __init__(self, times: array, offsets: array):
+        self.times = times  # seconds, ascending
+        self.offsets = offsets  # byte positions in the file
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def lookup(self, seconds: float) -> Optional[Tuple[float, int]]:
+        """Find the last keyframe at or before the given time"""
+        i = bisect_right(self.times, seconds) - 1
+        if i < 0:
+            return None
+        return self.times[i], self.offsets[i]
+
+class KeyframeService:
+    def __init__(self):
+        self._executor = ThreadPoolExecutor(
+            max_workers=settings.KEYFRAME_INDEX_WORKERS,
+            thread_name_prefix="keyframe-index"
+        )
+        # Builds a viewer is waiting for skip the background queue
+        self._urgent_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="keyframe-urgent")
+        self._lock = threading.RLock()
+        self._indexes: Dict[str, Tuple[Tuple[int, int], KeyframeIndex]] = {}
+        self._pending: Dict[str, Future] = {}
+        self._retry_after: Dict[str, float] = {}  # Transient failures, by monotonic time
+
+    def schedule(self, video_file: Path):
+        """Queue a background index build during the metadata pass"""
+        if video_file.suffix.lower() in settings.KEYFRAME_INDEX_FORMATS:
+            self._submit(video_file, urgent=False)
+
+    def get_index(self, video_file: Path) -> Optional[KeyframeIndex]:
+        """Return the cached index; if it isn't built yet, move it up the queue and return None"""
+        if video_file.suffix.lower() not in settings.KEYFRAME_INDEX_FORMATS:
+            return None
+        return self._submit(video_file, urgent=True)
+
+    def _submit(self, video_file: Path, urgent: bool) -> Optional[KeyframeIndex]:
+        key = str(video_file)
+        stat = video_file.stat()
+        version = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            cached = self._indexes.get(key)
+            if cached and cached[0] == version:
+                return cached[1]
+
+            if time.monotonic() < self._retry_after.get(key, 0):
+                return None
+
+            future = self._pending.get(key)
+            if future is not None:
+                # Pull a build still waiting in the background queue to the front
+                if not urgent or not future.cancel():
+                    return None
+
+            executor = self._urgent_executor if urgent else self._executor
+            future = executor.submit(self._build, video_file, version)
+            self._pending[key] = future
+            future.add_done_callback(lambda done: self._forget(key, done))
+            return None
+
+    def _forget(self, key: str, future: Future):
+        with self._lock:
+            if self._pending.get(key) is future:
+                del self._pending[key]
+
+    def _build(self, video_file: Path, version: Tuple[int, int]) -> Optional[KeyframeIndex]:
+        """Build and cache the index; bad files cache an empty one, transient errors retry later"""
+        key = str(video_file)
+        try:
+            index = self._read_keyframes(video_file)
+            print(f"Indexed {len(index)} keyframes for {video_file}")
+        except (subprocess.TimeoutExpired, OSError) as e:
+            # Slow or flaky mounts deserve another go
+            print(f"Error indexing keyframes for {video_file}, retrying later: {e}")
+            with self._lock:
+                self._retry_after[key] = time.monotonic() + settings.KEYFRAME_INDEX_RETRY
+            return None
+        except Exception as e:
+            print(f"Error indexing keyframes for {video_file}: {e}")
+            index = KeyframeIndex(array('d'), array('q'))
+
+        with self._lock:
+            self._retry_after.pop(key, None)
+            self._indexes[key] = (version, index)
+        return index
+
+    def _read_keyframes(self, video_file: Path) -> KeyframeIndex:
+        """Read video packet data with ffprobe and keep only keyframes"""
+        result = subprocess.run([
+            'ffprobe', '-v', 'error',
+            '-select_streams', 'v:0',
+            '-show_entries', 'packet=pts_time,dts_time,pos,flags',
+            '-of', 'compact=p=0',
+            str(video_file)
+        ], capture_output=True, text=True, timeout=settings.KEYFRAME_INDEX_TIMEOUT)
+
+        if result.returncode != 0:
+            raise RuntimeError(f"ffprobe failed for {video_file}: {result.stderr.strip()}")
+
+        times = array('d')
+        offsets = array('q')
+
+        for line in result.stdout.splitlines():
+            fields = dict(part.split('=', 1) for part in line.split('|') if '=' in part)
+            if 'K' not in fields.get('flags', ''):
+                continue
+
+            # AVI packets often lack pts, fall back to dts
+            timestamp = fields.get('pts_time', 'N/A')
+            if timestamp == 'N/A':
+                timestamp = fields.get('dts_time', 'N/A')
+            pos = fields.get('pos', 'N/A')
+            if timestamp == 'N/A' or pos == 'N/A':
+                continue
+
+            seconds = float(timestamp)
+            # Packets come in decode order, keep the index monotonic
+            if times and seconds <= times[-1]:
+                continue
+            times.append(seconds)
+            offsets.append(int(pos))
+
+        return KeyframeIndex(times, offsets)
+
+keyframe_service = KeyframeService()
@@ -0,0 +1,155 @@
+import hashlib
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError
+from typing import Callable, List, Optional, Tuple
+from pathlib import Path
+from app.config import settings
+from app.models.movie import RootHealth
+
+class LibraryRoot:
+    """One media folder with its own indexing worker and scan concurrency"""
+
+    def __init__(self, kind: str, path: Path, concurrency: int, id_prefix: str):
+        self.kind = kind
+        self.path = path
+        self.concurrency = concurrency
+        self.id_prefix = id_prefix
+        self.status = "pending"  # pending, online, slow, offline or error
+        self.error: Optional[str] = None
+        self.last_scan_seconds: Optional[float] = None
+        self.items: List = []  # Last good scan, kept while the root is unreachable
+        self.scan_count = 0  # Completed scans, versions each snapshot of items
+
+        # A single indexer walks the root; item work fans out to the scan workers
+        self._indexer = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"{kind}-index")
+        self._workers = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix=f"{kind}-scan")
+        self._lock = threading.Lock()
+        self._pending: Optional[Future] = None
+
+    @property
+    def scanning(self) -> bool:
+        return self._pending is not None
+
+    def scan(self, create_item: Callable) -> Future:
+        """Start a scan, or join the one already running"""
+        with self._lock:
+            if self._pending is None:
+                self._pending = self._indexer.submit(self._scan, create_item)
+            return self._pending
+
+    def _scan(self, create_item: Callable) -> Tuple[List, int]:
+        start = time.monotonic()
+        try:
+            if not self.path.exists():
+                raise FileNotFoundError(f"{self.kind} root does not exist: {self.path}")
+
+            print(f"Scanning {self.kind} root: {self.path}")
+            folders = [folder for folder in self.path.iterdir() if folder.is_dir()]
+            items = [
+                item for item in self._workers.map(lambda f: create_item(f, self.id_prefix), folders)
+                if item
+            ]
+            with self._lock:
+                self.items = items
+                self.scan_count += 1
+            self.last_scan_seconds = time.monotonic() - start
+            # Roots that outgrow the wait bound are served from cache from now on
+            self.status = "slow" if self.last_scan_seconds > settings.ROOT_SCAN_TIMEOUT else "online"
+            self.error = None
+        except Exception as e:
+            print(f"Error scanning {self.kind} root {self.path}: {e}")
+            self.status = "offline" if isinstance(e, OSError) else "error"
+            self.error = str(e)
+            with self._lock:
+                self.scan_count += 1
+        finally:
+            with self._lock:
+                self._pending = None
+        return self.snapshot()
+
+    def snapshot(self) -> Tuple[List, int]:
+        """Last good items together with the scan they came from"""
+        with self._lock:
+            return self.items, self.scan_count
+
+    def health(self) -> RootHealth:
+        return RootHealth(
+            kind=self.kind,
+            path=str(self.path),
+            status=self.status,
+            concurrency=self.concurrency,
+            item_count=len(self.items),
+            last_scan_seconds=self.last_scan_seconds,
+            error=self.error
+        )
+
+class MediaLibrary:
+    """Merges several roots of one media type into a single catalog"""
+
+    def __init__(self, kind: str, paths: List[str], legacy_path: str):
+        self.roots = []
+        self._publish_lock = threading.Lock()
+        self._published: Optional[Tuple[int, ...]] = None
+        for spec in (p.strip() for p in paths if p.strip()):
+            # "path|N" overrides the scan concurrency for that root
+            path, _, concurrency = spec.partition("|")
+            concurrency = int(concurrency) if concurrency else settings.ROOT_SCAN_CONCURRENCY
+            self.roots.append(LibraryRoot(kind, Path(path), concurrency, self._id_prefix(path, legacy_path)))
+
+    def _id_prefix(self, path: str, legacy_path: str) -> str:
+        """The legacy single root keeps bare IDs, others are namespaced by path"""
+        if os.path.normpath(path) == os.path.normpath(legacy_path):
+            return ""
+        # "-" never appears in generated IDs, so prefixed and bare IDs can't collide
+        return hashlib.sha1(os.path.normpath(path).encode()).hexdigest()[:6] + "-"
+
+    def scan(self, create_item: Callable) -> Tuple[List, Tuple[int, ...]]:
+        """Scan all roots in parallel; roots that can't answer quickly serve their last results.
+
+        Returns the merged items and the per-root scan counts they came from.
+        """
+        scans = []
+        for root in self.roots:
+            # Only wait on a fresh scan of a root known to be fast (or never scanned)
+            wait = not root.scanning and root.status in ("pending", "online")
+            scans.append((root, root.scan(create_item), wait))
+        deadline = time.monotonic() + settings.ROOT_SCAN_TIMEOUT
+
+        items = []
+        versions = []
+        for root, future, wait in scans:
+            if not wait and not future.done():
+                root_items, version = root.snapshot()
+            else:
+                try:
+                    root_items, version = future.result(timeout=max(deadline - time.monotonic(), 0))
+                except TimeoutError:
+                    print(f"{root.kind} root {root.path} is slow, using last scan")
+                    root.status = "slow"
+                    root_items, version = root.snapshot()
+            items.extend(root_items)
+            versions.append(version)
+        return items, tuple(versions)
+
+    def publish(self, snapshot: Tuple[int, ...], callback: Callable):
+        """Run callback for a snapshot only if it is newer than the last one published.
+
+        Concurrent scans can finish in any order; an older merge applied after a
+        newer one would look like removals. Nothing is published until every root
+        has finished its first scan.
+        """
+        if not all(snapshot):
+            return
+
+        with self._publish_lock:
+            published = self._published
+            if published is not None:
+                if snapshot == published or any(new < old for new, old in zip(snapshot, published)):
+                    return
+            self._published = snapshot
+            callback()
+
+    def health(self) -> List[RootHealth]:
+        return [root.health() for root in self.roots]
@@ -5,10 +5,15 @@ from typing import List, Optional
 from pathlib import Path
 from app.config import settings
 from app.models.movie import Movie, Subtitle
+from app.services.catalog_service import catalog_service
+from app.services.keyframe_service import keyframe_service
+from app.services.library_service import MediaLibrary
+from app.services.subtitle_service import subtitle_service
+from app.utils.languages import get_language_name
 
 class MovieService:
     def __init__(self):
-        self.movies_path = Path(settings.MOVIES_PATH)
+        self.library = MediaLibrary("movie", settings.MOVIES_PATHS, settings.MOVIES_PATH)
     
     def _get_video_duration(self, file_path: Path) -> Optional[float]:
         """Get video duration in seconds using ffprobe"""
@@ -28,28 +33,15 @@ class MovieService:
         return None
     
     def scan_movies(self) -> List[Movie]:
-        """Scan the movies directory and return list of movies"""
-        movies = []
-        
-        if not self.movies_path.exists():
-            print(f"Movies path does not exist: {self.movies_path}")
-            return movies
-        
-        print(f"Scanning movies in: {self.movies_path}")
-        
-        for movie_folder in self.movies_path.iterdir():
-            if movie_folder.is_dir():
-                print(f"Checking folder: {movie_folder}")
-                movie = self._create_movie_from_folder(movie_folder)
-                if movie:
-                    movies.append(movie)
-                    print(f"Added movie: {movie.title}")
+        """Scan all movie roots and return the merged list of movies"""
+        movies, snapshot = self.library.scan(self._create_movie_from_folder)
         
         print(f"Found {len(movies)} movies")
         movies.sort(key=lambda x: x.title.lower())
+        self.library.publish(snapshot, lambda: catalog_service.update("movie", movies))
         return movies
     
-    def _create_movie_from_folder(self, folder_path: Path) -> Optional[Movie]:
+    def _create_movie_from_folder(self, folder_path: Path, id_prefix: str = "") -> Optional[Movie]:
         """Create a Movie object from a folder"""
         try:
             # Find the video file
@@ -69,12 +61,14 @@ class MovieService:
             
             # Get video duration
             duration = self._get_video_duration(video_file)
+            keyframe_service.schedule(video_file)
             
-            # Find subtitles
+            # Find subtitles (sidecar files first, then embedded tracks)
             subtitles = self._find_subtitles(folder_path)
+            subtitles += subtitle_service.find_embedded_subtitles(video_file)
             
             return Movie(
-                id=self._generate_id(folder_name),
+                id=id_prefix + self._generate_id(folder_name),
                 title=title,
                 year=year,
                 folder_name=folder_name,
@@ -107,19 +101,7 @@ class MovieService:
     
     def _get_language_name(self, code: str) -> str:
         """Convert language code to full name"""
-        lang_map = {
-            'en': 'English',
-            'es': 'Spanish',
-            'fr': 'French',
-            'de': 'German',
-            'it': 'Italian',
-            'pt': 'Portuguese',
-            'ja': 'Japanese',
-            'ko': 'Korean',
-            'zh': 'Chinese',
-            'ru': 'Russian'
-        }
-        return lang_map.get(code, code.upper())
+        return get_language_name(code)
     
     def _extract_language(self, filename: str) -> str:
         """Extract language code from filename"""
@@ -4,30 +4,26 @@ from typing import List, Optional
 from pathlib import Path
 from app.config import settings
 from app.models.movie import Series, Season, Episode, Subtitle
+from app.services.catalog_service import catalog_service
+from app.services.keyframe_service import keyframe_service
+from app.services.library_service import MediaLibrary
+from app.services.subtitle_service import subtitle_service
 
 class SeriesService:
     def __init__(self):
-        self.series_path = Path(settings.SERIES_PATH)
+        self.library = MediaLibrary("series", settings.SERIES_PATHS, settings.SERIES_PATH)
     
     def scan_series(self) -> List[Series]:
-        """Scan the series directory and return list of series"""
-        all_series = []
-        
-        if not self.series_path.exists():
-            return all_series
-        
+        """Scan all series roots and return the merged list of series"""
         # Each series is in its own folder
-        for series_folder in self.series_path.iterdir():
-            if series_folder.is_dir():
-                series = self._create_series_from_folder(series_folder)
-                if series:
-                    all_series.append(series)
+        all_series, snapshot = self.library.scan(self._create_series_from_folder)
         
         # Sort alphabetically by title
         all_series.sort(key=lambda x: x.title.lower())
+        self.library.publish(snapshot, lambda: catalog_service.update("series", all_series))
         return all_series
     
-    def _create_series_from_folder(self, folder_path: Path) -> Optional[Series]:
+    def _create_series_from_folder(self, folder_path: Path, id_prefix: str = "") -> Optional[Series]:
         """Create a Series object from a folder"""
         try:
             folder_name = folder_path.name
@@ -39,10 +35,16 @@ class SeriesService:
             if not seasons:
                 return None
             
+            # Keep IDs unique across library roots
+            if id_prefix:
+                for season in seasons:
+                    for episode in season.episodes:
+                        episode.id = id_prefix + episode.id
+            
             total_episodes = sum(len(season.episodes) for season in seasons)
             
             return Series(
-                id=self._generate_id(folder_name),
+                id=id_prefix + self._generate_id(folder_name),
                 title=title,
                 year=year,
                 folder_name=folder_name,
@@ -105,6 +107,7 @@ class SeriesService:
             
             # Find subtitles in the same directory
             subtitles = self._find_episode_subtitles(file_path)
+            keyframe_service.schedule(file_path)
             
             episode_id = f"s{season_num:02d}e{episode_num:02d}_{self._generate_id(file_path.parent.parent.name)}"
             
@@ -137,6 +140,7 @@ class SeriesService:
                         filename=file.name
                     ))
         
+        subtitles += subtitle_service.find_embedded_subtitles(video_file)
         return subtitles
     
     def _extract_season_number(self, folder_name: str) -> Optional[int]:
@@ -1,5 +1,6 @@
 from pathlib import Path
-from typing import AsyncIterator
+from typing import AsyncIterator, Optional
+from urllib.parse import quote
 from app.config import settings
 
 class StreamingService:
@@ -23,5 +24,20 @@ class StreamingService:
                     break
                 remaining -= len(data)
                 yield data
+    
+    @staticmethod
+    def get_accel_redirect_uri(file_path: str) -> Optional[str]:
+        """Map a media file to the internal nginx location, if offloading applies"""
+        if not settings.ACCEL_REDIRECT_ENABLED:
+            return None
+        
+        try:
+            relative = Path(file_path).resolve().relative_to(Path(settings.MEDIA_ROOT).resolve())
+        except ValueError:
+            # Outside the media volume nginx can see, serve through Python
+            return None
+        
+        prefix = settings.ACCEL_REDIRECT_PREFIX.rstrip('/')
+        return f"{prefix}/{quote(relative.as_posix())}"
 
 streaming_service = StreamingService()
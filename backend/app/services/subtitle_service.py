@@ -0,0 +1,143 @@
+import asyncio
+import hashlib
+import json
+import os
+import subprocess
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Tuple
+from pathlib import Path
+from app.config import settings
+from app.models.movie import Subtitle
+from app.utils.languages import get_language_name
+
+class SubtitleService:
+    # Text-based codecs ffmpeg can convert to WebVTT (bitmap subs like PGS are skipped)
+    TEXT_CODECS = {"subrip", "srt", "ass", "ssa", "webvtt", "mov_text", "text"}
+
+    # ISO 639-2 codes reported by ffprobe -> 2-letter codes used elsewhere
+    LANGUAGE_CODES = {
+        'eng': 'en', 'spa': 'es', 'fre': 'fr', 'fra': 'fr',
+        'ger': 'de', 'deu': 'de', 'ita': 'it', 'por': 'pt',
+        'jpn': 'ja', 'kor': 'ko', 'chi': 'zh', 'zho': 'zh', 'rus': 'ru'
+    }
+
+    def __init__(self):
+        self.cache_path = Path(settings.SUBTITLE_CACHE_PATH)
+        self._executor = ThreadPoolExecutor(
+            max_workers=settings.SUBTITLE_EXTRACT_WORKERS,
+            thread_name_prefix="subtitle-extract"
+        )
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Future] = {}
+        self._probe_cache: Dict[Tuple[str, int, int], List[dict]] = {}
+
+    def find_embedded_subtitles(self, video_file: Path) -> List[Subtitle]:
+        """List text subtitle streams muxed inside a video file"""
+        if video_file.suffix.lower() not in settings.EMBEDDED_SUBTITLE_CONTAINERS:
+            return []
+
+        stat = video_file.stat()
+        subtitles = []
+
+        for stream in self._probe_subtitle_streams(video_file, stat):
+            if stream.get("codec_name") not in self.TEXT_CODECS:
+                continue
+
+            index = stream["index"]
+            tags = stream.get("tags", {})
+            raw_lang = tags.get("language", "und").lower()
+            lang_code = self.LANGUAGE_CODES.get(raw_lang, raw_lang)
+            cache_key = self._cache_key(video_file, stat, index)
+
+            subtitles.append(Subtitle(
+                language=tags.get("title") or get_language_name(lang_code),
+                language_code=lang_code,
+                file_path=str(self.cache_path / f"{cache_key}.vtt"),
+                filename=f"{video_file.stem}.embedded{index}.{lang_code}.vtt",
+                embedded=True,
+                stream_index=index,
+                source_path=str(video_file)
+            ))
+
+        return subtitles
+
+    def _probe_subtitle_streams(self, video_file: Path, stat: os.stat_result) -> List[dict]:
+        """Get subtitle stream info using ffprobe, cached per file version"""
+        key = (str(video_file), stat.st_mtime_ns, stat.st_size)
+        cached = self._probe_cache.get(key)
+        if cached is not None:
+            return cached
+
+        streams = []
+        try:
+            result = subprocess.run([
+                'ffprobe', '-v', 'error',
+                '-select_streams', 's',
+                '-show_entries', 'stream=index,codec_name:stream_tags=language,title',
+                '-of', 'json',
+                str(video_file)
+            ], capture_output=True, text=True, timeout=5)
+
+            if result.returncode == 0:
+                streams = json.loads(result.stdout).get("streams", [])
+        except Exception as e:
+            print(f"Error probing subtitles for {video_file}: {e}")
+            return streams
+
+        self._probe_cache[key] = streams
+        return streams
+
+    def _cache_key(self, video_file: Path, stat: os.stat_result, index: int) -> str:
+        """Key changes whenever the source file is replaced"""
+        raw = f"{video_file}:{stat.st_mtime_ns}:{stat.st_size}:{index}"
+        return hashlib.sha1(raw.encode()).hexdigest()
+
+    async def get_subtitle_path(self, subtitle: Subtitle) -> Path:
+        """Return the cached WebVTT file, extracting it first if needed"""
+        target = Path(subtitle.file_path)
+        if target.exists():
+            return target
+
+        with self._lock:
+            future = self._pending.get(subtitle.file_path)
+            if future is None:
+                future = self._executor.submit(self._extract, subtitle)
+                self._pending[subtitle.file_path] = future
+                future.add_done_callback(
+                    lambda _: self._forget(subtitle.file_path)
+                )
+
+        # Shielded so one cancelled request doesn't cancel the shared extraction
+        return await asyncio.shield(asyncio.wrap_future(future))
+
+    def _forget(self, key: str):
+        with self._lock:
+            self._pending.pop(key, None)
+
+    def _extract(self, subtitle: Subtitle) -> Path:
+        """Extract one subtitle stream to WebVTT using ffmpeg"""
+        target = Path(subtitle.file_path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = target.with_suffix(".tmp")
+
+        try:
+            result = subprocess.run([
+                'ffmpeg', '-v', 'error', '-y',
+                '-i', subtitle.source_path,
+                '-map', f'0:{subtitle.stream_index}',
+                '-f', 'webvtt',
+                str(tmp_path)
+            ], capture_output=True, text=True, timeout=settings.SUBTITLE_EXTRACT_TIMEOUT)
+
+            if result.returncode != 0:
+                raise RuntimeError(f"ffmpeg failed for {subtitle.source_path}: {result.stderr.strip()}")
+
+            # Atomic rename so readers never see a partial file
+            os.replace(tmp_path, target)
+        finally:
+            # Leftover only when ffmpeg failed or timed out
+            tmp_path.unlink(missing_ok=True)
+        return target
+
+subtitle_service = SubtitleService()
@@ -0,0 +1,16 @@
+LANGUAGE_NAMES = {
+    'en': 'English',
+    'es': 'Spanish',
+    'fr': 'French',
+    'de': 'German',
+    'it': 'Italian',
+    'pt': 'Portuguese',
+    'ja': 'Japanese',
+    'ko': 'Korean',
+    'zh': 'Chinese',
+    'ru': 'Russian'
+}
+
+def get_language_name(code: str) -> str:
+    """Convert language code to full name"""
+    return LANGUAGE_NAMES.get(code, code.upper())